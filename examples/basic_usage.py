@@ -8,12 +8,17 @@ This script demonstrates how to use the GRC tool programmatically.
 from grc_tool import GRCScanner
 from grc_tool.utils import Config, setup_logging
 import json
+from collections import Counter
+from itertools import islice
+
+SECTION_RULE = "-" * 50
+BANNER_RULE = "=" * 70
 
 
 def example_basic_scan():
     """Example: Basic network scan"""
     print("Example 1: Basic Network Scan")
-    print("-" * 50)
+    print(SECTION_RULE)
     
     # Initialize scanner with default configuration
     scanner = GRCScanner()
@@ -36,7 +41,7 @@ def example_basic_scan():
 def example_custom_config():
     """Example: Using custom configuration"""
     print("\nExample 2: Custom Configuration")
-    print("-" * 50)
+    print(SECTION_RULE)
     
     # Create custom configuration
     config = Config()
@@ -63,7 +68,7 @@ def example_custom_config():
 def example_analyze_results():
     """Example: Analyzing scan results"""
     print("\nExample 3: Analyzing Results")
-    print("-" * 50)
+    print(SECTION_RULE)
     
     scanner = GRCScanner()
     target = "127.0.0.1"
@@ -71,23 +76,23 @@ def example_analyze_results():
     
     # Analyze vulnerabilities
     vulnerabilities = results['vulnerabilities']
-    critical = [v for v in vulnerabilities if v.get('severity') == 'CRITICAL']
-    high = [v for v in vulnerabilities if v.get('severity') == 'HIGH']
+    severity_counts = Counter(v.get('severity') for v in vulnerabilities)
     
     print(f"\nVulnerability Analysis:")
-    print(f"  Critical: {len(critical)}")
-    print(f"  High: {len(high)}")
+    print(f"  Critical: {severity_counts['CRITICAL']}")
+    print(f"  High: {severity_counts['HIGH']}")
     
     # Analyze risks
     risks = results['risk_assessment']['evaluated_risks']
-    extreme_risks = [r for r in risks if r.get('risk_level') == 'EXTREME']
+    level_counts = Counter(r.get('risk_level') for r in risks)
     
     print(f"\nRisk Analysis:")
-    print(f"  Extreme risks: {len(extreme_risks)}")
+    print(f"  Extreme risks: {level_counts['EXTREME']}")
     
-    if extreme_risks:
+    if level_counts['EXTREME']:
         print("\n  Extreme Risk Details:")
-        for risk in extreme_risks[:3]:  # Show first 3
+        extreme_risks = (r for r in risks if r.get('risk_level') == 'EXTREME')
+        for risk in islice(extreme_risks, 3):  # Show first 3
             print(f"    - {risk.get('event')}")
             print(f"      Cause: {risk.get('cause')}")
             print(f"      CVSS: {risk.get('cvss_score')}")
@@ -112,7 +117,7 @@ def example_analyze_results():
 def example_access_ml_predictions():
     """Example: Accessing ML predictions"""
     print("\nExample 4: ML Predictions")
-    print("-" * 50)
+    print(SECTION_RULE)
     
     scanner = GRCScanner()
     target = "127.0.0.1"
@@ -148,26 +153,33 @@ def example_access_ml_predictions():
     return results
 
 
-def example_save_results():
-    """Example: Saving results to file"""
+def example_save_results(compact: bool = False):
+    """Example: Saving results to file
+    
+    Set compact=True for large scans: the output is written without
+    indentation and with minimal separators, which is faster to encode
+    and much smaller on disk.
+    """
     print("\nExample 5: Saving Results")
-    print("-" * 50)
+    print(SECTION_RULE)
     
     scanner = GRCScanner()
     target = "127.0.0.1"
     results = scanner.scan(target, quick=True)
     
+    dump_options = {"separators": (',', ':')} if compact else {"indent": 2}
+    
     # Save complete results to JSON
     output_file = "scan_results.json"
     with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+        json.dump(results, f, **dump_options)
     
     print(f"Results saved to: {output_file}")
     
     # Save specific sections
     risks_file = "risks_only.json"
     with open(risks_file, 'w') as f:
-        json.dump(results['risk_assessment']['evaluated_risks'], f, indent=2)
+        json.dump(results['risk_assessment']['evaluated_risks'], f, **dump_options)
     
     print(f"Risks saved to: {risks_file}")
     
@@ -177,7 +189,7 @@ def example_save_results():
 def example_network_range_scan():
     """Example: Scanning a network range"""
     print("\nExample 6: Network Range Scan")
-    print("-" * 50)
+    print(SECTION_RULE)
     
     # NOTE: This requires appropriate permissions
     # Replace with your actual network range
@@ -196,9 +208,9 @@ def example_network_range_scan():
 
 def main():
     """Run all examples"""
-    print("=" * 70)
+    print(BANNER_RULE)
     print("GRC Compliance Tool - Usage Examples")
-    print("=" * 70)
+    print(BANNER_RULE)
     
     try:
         # Run examples
@@ -209,9 +221,9 @@ def main():
         example_save_results()
         example_network_range_scan()
         
-        print("\n" + "=" * 70)
+        print("\n" + BANNER_RULE)
         print("All examples completed successfully!")
-        print("=" * 70)
+        print(BANNER_RULE)
         
     except Exception as e:
         print(f"\nError running examples: {str(e)}")
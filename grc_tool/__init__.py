@@ -12,6 +12,13 @@ automated mitigation recommendations.
 __version__ = "1.0.0"
 __author__ = "GRC Compliance Team"
 
-from .main import GRCScanner
-
 __all__ = ["GRCScanner"]
+
+
+def __getattr__(name):
+    # Defer importing .main (and the scanner/ML stack behind it) until
+    # GRCScanner is actually requested.
+    if name == "GRCScanner":
+        from .main import GRCScanner
+        return GRCScanner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,20 +5,51 @@ Orchestrates the complete GRC compliance scanning and risk assessment process.
 
 import logging
 import argparse
-from typing import Dict, Optional
+import sys
+from itertools import chain
+from typing import Dict, Iterable, Optional
 from colorama import init, Fore, Style
 
-from .scanner import NetworkScanner, VulnerabilityScanner, ServiceDetector
-from .ml_engine import ThreatDetector, AnomalyDetector, RiskPredictor
-from .risk_assessment import ISO31000Framework, RiskAnalyzer, RiskEvaluator
-from .mitigation import MitigationEngine, RemediationPlanner
-from .reporting import ReportGenerator
 from .utils import setup_logging, Config
 
 init(autoreset=True)  # Initialize colorama
 
 logger = logging.getLogger(__name__)
 
+# Console colors, resolved once instead of per print
+_CYAN = Fore.CYAN
+_GREEN = Fore.GREEN
+_YELLOW = Fore.YELLOW
+_RED = Fore.RED
+_RESET = Style.RESET_ALL
+
+SCAN_STEPS = (
+    "Network Scanning",
+    "Vulnerability Scanning",
+    "ML-based Threat Detection",
+    "Anomaly Detection",
+    "ISO 31000 Risk Assessment",
+    "Detailed Risk Analysis",
+    "Risk Prediction (ML)",
+    "Generating Mitigation Strategies",
+    "Generating Report",
+)
+STEP_HEADERS = tuple(
+    f"\n{_CYAN}[{i}/{len(SCAN_STEPS)}] {name}...{_RESET}"
+    for i, name in enumerate(SCAN_STEPS, 1)
+)
+STAGE_SKIPPED = f"{_YELLOW}- Skipped (stage disabled){_RESET}"
+
+# Optional ML stages of GRCScanner.scan; components for disabled stages are
+# never imported or constructed.
+ML_STAGES = ("threat_detection", "anomaly_detection", "risk_prediction")
+
+
+def _write_progress(text: str):
+    """Write scan progress text to stdout and flush it in one go."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
 
 class GRCScanner:
     """
@@ -28,20 +59,46 @@ class GRCScanner:
     with ML-based threat detection and automated mitigation recommendations.
     """
     
-    def __init__(self, config: Config = None):
+    def __init__(self, config: Config = None, enabled_stages: Optional[Iterable[str]] = None):
         """
         Initialize GRC Scanner.
         
         Args:
             config: Configuration object
+            enabled_stages: ML stages to run (see ML_STAGES); defaults to
+                ``ml_engine.enabled_stages`` from the configuration, or all
         """
         self.config = config or Config()
         
+        if enabled_stages is None:
+            enabled_stages = self.config.get("ml_engine.enabled_stages", ML_STAGES)
+            if not isinstance(enabled_stages, (list, tuple)):
+                raise ValueError(
+                    "ml_engine.enabled_stages must be a list of ML stage names "
+                    f"({', '.join(ML_STAGES)}), got {enabled_stages!r}"
+                )
+        elif isinstance(enabled_stages, str):
+            raise ValueError(
+                f"enabled_stages must be an iterable of ML stage names, not the string {enabled_stages!r}"
+            )
+        self.enabled_stages = frozenset(enabled_stages)
+        unknown_stages = self.enabled_stages.difference(ML_STAGES)
+        if unknown_stages:
+            raise ValueError(f"Unknown ML stage(s): {', '.join(sorted(unknown_stages))}")
+        
         # Setup logging
         log_level = self.config.get("logging.level", "INFO")
         log_file = self.config.get("logging.file")
         setup_logging(level=log_level, log_file=log_file)
         
+        # Component imports are deferred to here so that importing this
+        # module (e.g. for ``grc-scan --help``) does not load nmap, numpy
+        # and scikit-learn.
+        from .scanner import NetworkScanner, VulnerabilityScanner, ServiceDetector
+        from .risk_assessment import ISO31000Framework, RiskAnalyzer, RiskEvaluator
+        from .mitigation import MitigationEngine, RemediationPlanner
+        from .reporting import ReportGenerator
+        
         # Initialize components
         self.network_scanner = NetworkScanner(
             timeout=self.config.get("scanning.timeout", 30),
@@ -49,9 +106,18 @@ class GRCScanner:
         )
         self.vulnerability_scanner = VulnerabilityScanner()
         self.service_detector = ServiceDetector()
-        self.threat_detector = ThreatDetector()
-        self.anomaly_detector = AnomalyDetector()
-        self.risk_predictor = RiskPredictor()
+        self.threat_detector = None
+        self.anomaly_detector = None
+        self.risk_predictor = None
+        if "threat_detection" in self.enabled_stages:
+            from .ml_engine import ThreatDetector
+            self.threat_detector = ThreatDetector()
+        if "anomaly_detection" in self.enabled_stages:
+            from .ml_engine import AnomalyDetector
+            self.anomaly_detector = AnomalyDetector()
+        if "risk_prediction" in self.enabled_stages:
+            from .ml_engine import RiskPredictor
+            self.risk_predictor = RiskPredictor()
         self.iso31000 = ISO31000Framework()
         self.risk_analyzer = RiskAnalyzer()
         self.risk_evaluator = RiskEvaluator(
@@ -76,120 +142,157 @@ class GRCScanner:
         Returns:
             Complete scan results
         """
-        logger.info(f"{Fore.GREEN}Starting GRC compliance scan for target: {target}{Style.RESET_ALL}")
+        logger.info("%sStarting GRC compliance scan for target: %s%s", _GREEN, target, _RESET)
+        
+        stages = (
+            self._stage_network_scan,
+            self._stage_vulnerability_scan,
+            self._stage_threat_detection,
+            self._stage_anomaly_detection,
+            self._stage_risk_assessment,
+            self._stage_risk_analysis,
+            self._stage_risk_prediction,
+            self._stage_mitigation_planning,
+            self._stage_report,
+        )
+        
+        # Stages read their inputs from and write their outputs to ctx
+        ctx = {"target": target, "quick": quick}
+        
+        # Each stage's status line is held back and written together with
+        # the next header, so progress costs one write and flush per stage.
+        pending = ""
+        for header, stage in zip(STEP_HEADERS, stages):
+            _write_progress(f"{pending}{header}\n")
+            outcome = stage(ctx)
+            if "error" in ctx:
+                return {"error": ctx["error"]}
+            pending = STAGE_SKIPPED if outcome is None else f"{_GREEN}✓ {outcome}{_RESET}"
+            pending += "\n"
+        _write_progress(pending)
+        
+        # Display summary
+        self._display_summary(ctx["report"])
         
-        # Step 1: Network Scanning
-        print(f"\n{Fore.CYAN}[1/9] Network Scanning...{Style.RESET_ALL}")
-        if quick:
-            scan_results = self.network_scanner.quick_scan(target)
+        logger.info("GRC compliance scan completed successfully")
+        return ctx["complete_data"]
+    
+    def _stage_network_scan(self, ctx: Dict) -> Optional[str]:
+        """Step 1: discover hosts and services."""
+        if ctx["quick"]:
+            scan_results = self.network_scanner.quick_scan(ctx["target"])
         else:
-            scan_results = self.network_scanner.scan_network(target)
+            scan_results = self.network_scanner.scan_network(ctx["target"])
         
         if not scan_results.get("hosts"):
             logger.error("No hosts found. Scan failed.")
-            return {"error": "No hosts discovered"}
+            ctx["error"] = "No hosts discovered"
+            return None
         
-        print(f"{Fore.GREEN}✓ Found {len(scan_results['hosts'])} hosts{Style.RESET_ALL}")
-        
-        # Step 2: Vulnerability Scanning
-        print(f"\n{Fore.CYAN}[2/9] Vulnerability Scanning...{Style.RESET_ALL}")
-        all_vulnerabilities = []
-        for host, host_data in scan_results["hosts"].items():
-            services = host_data.get("protocols", {})
-            vulns = self.vulnerability_scanner.scan_host(host, services)
-            all_vulnerabilities.extend(vulns)
-        
-        print(f"{Fore.GREEN}✓ Identified {len(all_vulnerabilities)} vulnerabilities{Style.RESET_ALL}")
-        
-        # Step 3: Threat Detection (ML)
-        print(f"\n{Fore.CYAN}[3/9] ML-based Threat Detection...{Style.RESET_ALL}")
-        threats = self.threat_detector.detect_threats(scan_results)
-        print(f"{Fore.GREEN}✓ Detected {len(threats)} potential threats{Style.RESET_ALL}")
-        
-        # Step 4: Anomaly Detection
-        print(f"\n{Fore.CYAN}[4/9] Anomaly Detection...{Style.RESET_ALL}")
-        anomalies = self.anomaly_detector.detect_anomalies(scan_results)
-        print(f"{Fore.GREEN}✓ Found {len(anomalies)} anomalies{Style.RESET_ALL}")
-        
-        # Step 5: ISO 31000 Risk Assessment
-        print(f"\n{Fore.CYAN}[5/9] ISO 31000 Risk Assessment...{Style.RESET_ALL}")
-        
-        # Establish context
+        ctx["scan_results"] = scan_results
+        return f"Found {len(scan_results['hosts'])} hosts"
+    
+    def _stage_vulnerability_scan(self, ctx: Dict) -> Optional[str]:
+        """Step 2: check every discovered service for vulnerabilities."""
+        scan_host = self.vulnerability_scanner.scan_host
+        vulnerabilities = list(chain.from_iterable(
+            scan_host(host, host_data.get("protocols", {}))
+            for host, host_data in ctx["scan_results"]["hosts"].items()
+        ))
+        
+        ctx["vulnerabilities"] = vulnerabilities
+        return f"Identified {len(vulnerabilities)} vulnerabilities"
+    
+    def _stage_threat_detection(self, ctx: Dict) -> Optional[str]:
+        """Step 3: ML-based threat detection."""
+        if self.threat_detector is None:
+            ctx["threats"] = []
+            return None
+        
+        threats = self.threat_detector.detect_threats(ctx["scan_results"])
+        ctx["threats"] = threats
+        return f"Detected {len(threats)} potential threats"
+    
+    def _stage_anomaly_detection(self, ctx: Dict) -> Optional[str]:
+        """Step 4: anomaly detection."""
+        if self.anomaly_detector is None:
+            ctx["anomalies"] = []
+            return None
+        
+        anomalies = self.anomaly_detector.detect_anomalies(ctx["scan_results"])
+        ctx["anomalies"] = anomalies
+        return f"Found {len(anomalies)} anomalies"
+    
+    def _stage_risk_assessment(self, ctx: Dict) -> Optional[str]:
+        """Step 5: ISO 31000 context, criteria, identification, analysis and evaluation."""
         context = self.iso31000.establish_context({})
-        
-        # Define risk criteria
-        criteria = self.iso31000.define_risk_criteria()
-        
-        # Identify risks
-        identified_risks = self.iso31000.identify_risks(scan_results, all_vulnerabilities)
-        
-        # Analyze risks
+        criteria = self.iso31000.define_risk_criteria(risk_appetite=self.risk_evaluator.risk_appetite)
+        identified_risks = self.iso31000.identify_risks(ctx["scan_results"], ctx["vulnerabilities"])
         analyzed_risks = self.iso31000.analyze_risks(identified_risks)
-        
-        # Evaluate risks
         evaluated_risks = self.iso31000.evaluate_risks(analyzed_risks)
         
-        print(f"{Fore.GREEN}✓ Assessed {len(evaluated_risks)} risks per ISO 31000{Style.RESET_ALL}")
-        
-        # Step 6: Risk Analysis
-        print(f"\n{Fore.CYAN}[6/9] Detailed Risk Analysis...{Style.RESET_ALL}")
-        quantitative_analysis = self.risk_analyzer.perform_quantitative_analysis(evaluated_risks)
-        qualitative_analysis = self.risk_analyzer.perform_qualitative_analysis(evaluated_risks)
-        risk_aggregation = self.risk_analyzer.assess_risk_aggregation(evaluated_risks)
-        
-        print(f"{Fore.GREEN}✓ Risk analysis completed{Style.RESET_ALL}")
-        
-        # Step 7: Risk Prediction
-        print(f"\n{Fore.CYAN}[7/9] Risk Prediction (ML)...{Style.RESET_ALL}")
-        risk_predictions = self.risk_predictor.predict_future_risks(evaluated_risks)
-        print(f"{Fore.GREEN}✓ Future risk predictions generated{Style.RESET_ALL}")
-        
-        # Step 8: Mitigation Planning
-        print(f"\n{Fore.CYAN}[8/9] Generating Mitigation Strategies...{Style.RESET_ALL}")
-        evaluation_results = self.risk_evaluator.evaluate_against_criteria(evaluated_risks)
-        prioritized_risks = self.risk_evaluator.prioritize_risks(evaluation_results["unacceptable_risks"])
+        ctx["risk_assessment"] = {
+            "context": context,
+            "criteria": criteria,
+            "identified_risks": identified_risks,
+            "analyzed_risks": analyzed_risks,
+            "evaluated_risks": evaluated_risks
+        }
+        return f"Assessed {len(evaluated_risks)} risks per ISO 31000"
+    
+    def _stage_risk_analysis(self, ctx: Dict) -> Optional[str]:
+        """Step 6: quantitative, qualitative and aggregate risk analysis."""
+        risk_assessment = ctx["risk_assessment"]
+        evaluated_risks = risk_assessment["evaluated_risks"]
+        
+        risk_assessment["quantitative_analysis"] = self.risk_analyzer.perform_quantitative_analysis(evaluated_risks)
+        risk_assessment["qualitative_analysis"] = self.risk_analyzer.perform_qualitative_analysis(evaluated_risks)
+        risk_assessment["risk_aggregation"] = self.risk_analyzer.assess_risk_aggregation(evaluated_risks)
+        return "Risk analysis completed"
+    
+    def _stage_risk_prediction(self, ctx: Dict) -> Optional[str]:
+        """Step 7: ML-based risk prediction."""
+        if self.risk_predictor is None:
+            ctx["risk_predictions"] = {}
+            return None
+        
+        evaluated_risks = ctx["risk_assessment"]["evaluated_risks"]
+        ctx["risk_predictions"] = self.risk_predictor.predict_future_risks(evaluated_risks)
+        return "Future risk predictions generated"
+    
+    def _stage_mitigation_planning(self, ctx: Dict) -> Optional[str]:
+        """Step 8: mitigation strategies and remediation plan for unacceptable risks."""
+        # Step 5 evaluated against the same risk appetite as risk_evaluator,
+        # so reuse its verdicts instead of re-evaluating every risk.
+        unacceptable_risks = [
+            risk for risk in ctx["risk_assessment"]["evaluated_risks"]
+            if risk.get("treatment_required")
+        ]
+        prioritized_risks = self.risk_evaluator.prioritize_risks(unacceptable_risks)
         
         mitigation_plan = self.mitigation_engine.generate_mitigations(prioritized_risks)
-        remediation_plan = self.remediation_planner.create_remediation_plan(mitigation_plan)
-        
-        print(f"{Fore.GREEN}✓ Mitigation strategies generated{Style.RESET_ALL}")
-        
-        # Step 9: Report Generation
-        print(f"\n{Fore.CYAN}[9/9] Generating Report...{Style.RESET_ALL}")
-        
+        ctx["mitigation_plan"] = mitigation_plan
+        ctx["remediation_plan"] = self.remediation_planner.create_remediation_plan(mitigation_plan)
+        return "Mitigation strategies generated"
+    
+    def _stage_report(self, ctx: Dict) -> Optional[str]:
+        """Step 9: assemble the complete results and generate the report."""
         complete_data = {
-            "scan_results": scan_results,
-            "vulnerabilities": all_vulnerabilities,
-            "threats": threats,
-            "anomalies": anomalies,
-            "risk_assessment": {
-                "context": context,
-                "criteria": criteria,
-                "identified_risks": identified_risks,
-                "analyzed_risks": analyzed_risks,
-                "evaluated_risks": evaluated_risks,
-                "quantitative_analysis": quantitative_analysis,
-                "qualitative_analysis": qualitative_analysis,
-                "risk_aggregation": risk_aggregation
-            },
-            "risk_predictions": risk_predictions,
-            "threat_analysis": {
-                "threats": threats,
-                "anomalies": anomalies
-            },
-            "mitigation_plan": mitigation_plan,
-            "remediation_plan": remediation_plan
+            key: ctx[key] for key in (
+                "scan_results",
+                "vulnerabilities",
+                "threats",
+                "anomalies",
+                "risk_assessment",
+                "risk_predictions",
+                "mitigation_plan",
+                "remediation_plan"
+            )
         }
         
-        report = self.report_generator.generate_comprehensive_report(complete_data)
-        
-        print(f"{Fore.GREEN}✓ Report generated successfully{Style.RESET_ALL}")
-        
-        # Display summary
-        self._display_summary(report)
-        
-        logger.info("GRC compliance scan completed successfully")
-        return complete_data
+        ctx["complete_data"] = complete_data
+        ctx["report"] = self.report_generator.generate_comprehensive_report(complete_data)
+        return "Report generated successfully"
     
     def _display_summary(self, report: Dict):
         """
@@ -198,33 +301,38 @@ class GRCScanner:
         Args:
             report: Generated report
         """
-        print(f"\n{Fore.YELLOW}{'=' * 70}{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}GRC COMPLIANCE SCAN SUMMARY{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}{'=' * 70}{Style.RESET_ALL}")
-        
         exec_summary = report.get("executive_summary", {})
         key_findings = exec_summary.get("key_findings", {})
-        
-        print(f"\n{Fore.CYAN}Overall Risk Rating:{Style.RESET_ALL} {exec_summary.get('overall_risk_rating', 'N/A')}")
-        print(f"{Fore.CYAN}Compliance Status:{Style.RESET_ALL} {exec_summary.get('compliance_status', 'N/A')}")
-        
-        print(f"\n{Fore.CYAN}Key Findings:{Style.RESET_ALL}")
-        print(f"  • Hosts Scanned: {key_findings.get('total_hosts_scanned', 0)}")
-        print(f"  • Vulnerabilities: {key_findings.get('total_vulnerabilities', 0)}")
-        print(f"  • Risks Identified: {key_findings.get('total_risks_identified', 0)}")
-        print(f"  • {Fore.RED}Critical Risks: {key_findings.get('critical_risks', 0)}{Style.RESET_ALL}")
-        print(f"  • {Fore.YELLOW}High Risks: {key_findings.get('high_risks', 0)}{Style.RESET_ALL}")
-        print(f"  • Threats Detected: {key_findings.get('threats_detected', 0)}")
+        rule = f"{_YELLOW}{'=' * 70}{_RESET}"
+        
+        lines = [
+            f"\n{rule}",
+            f"{_YELLOW}GRC COMPLIANCE SCAN SUMMARY{_RESET}",
+            rule,
+            f"\n{_CYAN}Overall Risk Rating:{_RESET} {exec_summary.get('overall_risk_rating', 'N/A')}",
+            f"{_CYAN}Compliance Status:{_RESET} {exec_summary.get('compliance_status', 'N/A')}",
+            f"\n{_CYAN}Key Findings:{_RESET}",
+            f"  • Hosts Scanned: {key_findings.get('total_hosts_scanned', 0)}",
+            f"  • Vulnerabilities: {key_findings.get('total_vulnerabilities', 0)}",
+            f"  • Risks Identified: {key_findings.get('total_risks_identified', 0)}",
+            f"  • {_RED}Critical Risks: {key_findings.get('critical_risks', 0)}{_RESET}",
+            f"  • {_YELLOW}High Risks: {key_findings.get('high_risks', 0)}{_RESET}",
+            f"  • Threats Detected: {key_findings.get('threats_detected', 0)}",
+        ]
         
         if exec_summary.get('immediate_actions_required', 0) > 0:
-            print(f"\n{Fore.RED}⚠ IMMEDIATE ACTIONS REQUIRED: {exec_summary.get('immediate_actions_required', 0)}{Style.RESET_ALL}")
+            lines.append(f"\n{_RED}⚠ IMMEDIATE ACTIONS REQUIRED: {exec_summary.get('immediate_actions_required', 0)}{_RESET}")
+        
+        lines.append(f"\n{_CYAN}Top Recommendations:{_RESET}")
+        lines.extend(
+            f"  {i}. {rec}"
+            for i, rec in enumerate(exec_summary.get('key_recommendations', [])[:5], 1)
+        )
         
-        print(f"\n{Fore.CYAN}Top Recommendations:{Style.RESET_ALL}")
-        for i, rec in enumerate(exec_summary.get('key_recommendations', [])[:5], 1):
-            print(f"  {i}. {rec}")
+        lines.append(f"\n{rule}")
+        lines.append(f"\n{_GREEN}Full report saved to: {self.report_generator.output_dir}{_RESET}\n")
         
-        print(f"\n{Fore.YELLOW}{'=' * 70}{Style.RESET_ALL}")
-        print(f"\n{Fore.GREEN}Full report saved to: {self.report_generator.output_dir}{Style.RESET_ALL}\n")
+        print("\n".join(lines))
 
 
 def main():
@@ -289,17 +397,17 @@ For more information, visit: https://github.com/Ayushya-15/GRC
         results = scanner.scan(args.target, quick=args.quick)
         
         if "error" in results:
-            print(f"{Fore.RED}Scan failed: {results['error']}{Style.RESET_ALL}")
+            print(f"{_RED}Scan failed: {results['error']}{_RESET}")
             return 1
         
         return 0
     
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW}Scan interrupted by user{Style.RESET_ALL}")
+        print(f"\n{_YELLOW}Scan interrupted by user{_RESET}")
         return 130
     
     except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}{Style.RESET_ALL}")
+        print(f"{_RED}Error: {str(e)}{_RESET}")
         logger.exception("Scan failed with exception")
         return 1
 
@@ -4,10 +4,232 @@ Generates automated mitigation recommendations for identified risks.
 """
 
 import logging
-from typing import Dict, List, Optional
+from itertools import chain
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Priority bucket for each severity; anything else is handled as routine
+SEVERITY_BUCKETS = {
+    "EXTREME": "immediate",
+    "HIGH": "urgent",
+    "MEDIUM": "scheduled",
+    "LOW": "routine"
+}
+
+# Severity band used as the major component of a plan's priority score
+SEVERITY_RANK = {
+    "EXTREME": 4,
+    "HIGH": 3,
+    "MEDIUM": 2,
+    "LOW": 1
+}
+
+# Exploitation probability for ISO 31000 likelihood labels (midpoints of the
+# likelihood_criteria ranges); also accepted for exploitation_likelihood labels
+LIKELIHOOD_PROBABILITY = {
+    "VERY_HIGH": 0.95,
+    "HIGH": 0.8,
+    "MEDIUM": 0.5,
+    "LOW": 0.2,
+    "VERY_LOW": 0.05
+}
+
+# Success criteria and validation method shared by every mitigation plan
+SUCCESS_CRITERIA = (
+    "Vulnerability no longer detected in subsequent scans",
+    "Risk score reduced to acceptable level",
+    "No security incidents related to this risk",
+    "Compliance requirements met",
+    "System functionality maintained"
+)
+VALIDATION_METHOD = "Re-scan with GRC tool + manual verification + penetration testing"
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively convert dicts to read-only mappings and lists to tuples.
+    
+    Args:
+        value: Value to freeze
+        
+    Returns:
+        Read-only equivalent of value
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Mitigation strategy database, keyed by risk or vulnerability type. Frozen all
+# the way down and shared by every engine, so the aggregates and plan caches
+# built from it can never go stale; plans receive plain dict copies.
+_MITIGATION_DB = _freeze({
+    "Outdated Software": (
+        {
+            "strategy": "Update to Latest Version",
+            "description": "Apply latest security patches and updates",
+            "steps": [
+                "Backup current system configuration",
+                "Test update in staging environment",
+                "Schedule maintenance window",
+                "Apply updates to production",
+                "Verify system functionality",
+                "Document changes"
+            ],
+            "effort_hours": 4,
+            "resources": ["System Administrator", "Patch Management Tools"],
+            "time_per_step": "30-60 minutes"
+        },
+    ),
+    "Default Credentials": (
+        {
+            "strategy": "Change Default Credentials",
+            "description": "Implement strong authentication",
+            "steps": [
+                "Identify all accounts with default credentials",
+                "Generate strong passwords per policy",
+                "Update credentials in systems",
+                "Update dependent systems and scripts",
+                "Document new credentials securely",
+                "Verify authentication works correctly"
+            ],
+            "effort_hours": 2,
+            "resources": ["Security Administrator", "Password Manager"],
+            "time_per_step": "15-30 minutes"
+        },
+        {
+            "strategy": "Implement MFA",
+            "description": "Add multi-factor authentication",
+            "steps": [
+                "Select MFA solution",
+                "Configure MFA for critical systems",
+                "Enroll users in MFA",
+                "Test MFA functionality",
+                "Document MFA procedures"
+            ],
+            "effort_hours": 8,
+            "resources": ["Security Team", "MFA Solution", "User Training"],
+            "time_per_step": "1-2 hours",
+            "tool_cost": 500
+        },
+    ),
+    "SSL/TLS Configuration": (
+        {
+            "strategy": "Strengthen SSL/TLS Configuration",
+            "description": "Implement secure cryptographic configuration",
+            "steps": [
+                "Disable SSLv2, SSLv3, TLS 1.0, TLS 1.1",
+                "Enable TLS 1.2 and TLS 1.3",
+                "Configure strong cipher suites",
+                "Implement HSTS",
+                "Update SSL certificates if needed",
+                "Test configuration with SSL Labs"
+            ],
+            "effort_hours": 3,
+            "resources": ["Network Administrator", "SSL/TLS Tools"],
+            "time_per_step": "30 minutes"
+        },
+    ),
+    "Weak Cipher Suites": (
+        {
+            "strategy": "Update Cipher Configuration",
+            "description": "Remove weak ciphers and implement strong ones",
+            "steps": [
+                "Audit current cipher configuration",
+                "Disable weak ciphers (RC4, DES, 3DES)",
+                "Enable strong ciphers (AES-256-GCM)",
+                "Test compatibility with clients",
+                "Monitor for connection issues",
+                "Document configuration changes"
+            ],
+            "effort_hours": 2,
+            "resources": ["Security Administrator"],
+            "time_per_step": "20 minutes"
+        },
+    ),
+    "Missing Security Patches": (
+        {
+            "strategy": "Implement Patch Management",
+            "description": "Establish systematic patching process",
+            "steps": [
+                "Inventory all systems and software",
+                "Subscribe to security advisories",
+                "Test patches in staging",
+                "Deploy patches to production",
+                "Verify patch installation",
+                "Establish regular patching schedule"
+            ],
+            "effort_hours": 6,
+            "resources": ["IT Team", "Patch Management System", "Testing Environment"],
+            "time_per_step": "1 hour"
+        },
+    ),
+    "Service Misconfiguration": (
+        {
+            "strategy": "Harden Service Configuration",
+            "description": "Apply security hardening best practices",
+            "steps": [
+                "Review current configuration",
+                "Apply CIS benchmarks or hardening guides",
+                "Disable unnecessary features",
+                "Implement least privilege",
+                "Enable security logging",
+                "Test service functionality"
+            ],
+            "effort_hours": 4,
+            "resources": ["Security Team", "Configuration Management Tools"],
+            "time_per_step": "40 minutes"
+        },
+    ),
+    "General": (
+        {
+            "strategy": "General Security Enhancement",
+            "description": "Apply general security best practices",
+            "steps": [
+                "Review security configurations",
+                "Apply security updates",
+                "Implement access controls",
+                "Enable security monitoring",
+                "Document changes"
+            ],
+            "effort_hours": 3,
+            "resources": ["Security Team"],
+            "time_per_step": "30-45 minutes"
+        },
+    )
+})
+
+
+def _aggregate_strategies(strategies: Tuple[Dict, ...]) -> Dict:
+    """
+    Pre-compute effort, cost and resource totals for a strategy list.
+    
+    Args:
+        strategies: Mitigation strategies
+        
+    Returns:
+        Dict with hours, tool_cost and resources
+    """
+    resources = set()
+    for strategy in strategies:
+        resources.update(strategy.get("resources", []))
+    
+    return MappingProxyType({
+        "hours": sum(strategy.get("effort_hours", 2) for strategy in strategies),
+        "tool_cost": sum(strategy.get("tool_cost", 0) for strategy in strategies),
+        "resources": frozenset(resources)
+    })
+
+
+# Effort, cost and resource totals per database key, computed once at import
+_DB_AGGREGATES = MappingProxyType({
+    key: _aggregate_strategies(strategies) for key, strategies in _MITIGATION_DB.items()
+})
+
 
 class MitigationEngine:
     """
@@ -18,6 +240,8 @@ class MitigationEngine:
     def __init__(self):
         """Initialize Mitigation Engine."""
         self.mitigation_database = self._load_mitigation_database()
+        self._db_aggregates = _DB_AGGREGATES
+        self._plan_cache: Dict[Tuple[str, str, str], Dict] = {}
         logger.info("MitigationEngine initialized")
     
     def generate_mitigations(self, risks: List[Dict]) -> Dict:
@@ -32,6 +256,10 @@ class MitigationEngine:
         """
         logger.info("Generating mitigation strategies")
         
+        if not risks:
+            logger.info("No risks require mitigation")
+            return self._organize_mitigations([])
+        
         mitigation_plans = []
         
         for risk in risks:
@@ -59,61 +287,185 @@ class MitigationEngine:
         severity = risk.get("risk_level", "LOW")
         vulnerability = risk.get("vulnerability_ref", {})
         
+        # Plans only differ by risk_id within a (type, severity, vuln type) class
+        key = (risk_type, severity, vulnerability.get("type", ""))
+        template = self._plan_cache.get(key)
+        if template is None:
+            template = self._build_plan_template(risk_type, severity, vulnerability)
+            self._plan_cache[key] = template
+        
+        # The cached template is shared; every container a caller may update
+        # per plan (step status, resources, costs) is rebuilt for each risk
+        strategies = template["strategies"]
+        return {
+            "risk_id": risk.get("risk_id", "Unknown"),
+            **template,
+            "strategies": [dict(strategy) for strategy in strategies],
+            "implementation_steps": self._generate_implementation_steps(strategies),
+            "required_resources": list(template["required_resources"]),
+            "cost_estimate": dict(template["cost_estimate"]),
+            "priority_score": self._calculate_priority_score(severity, risk)
+        }
+    
+    def _calculate_priority_score(self, severity: str, risk: Dict) -> float:
+        """
+        Score a plan on severity and exploitation likelihood.
+        
+        Args:
+            severity: Risk severity
+            risk: Risk information
+            
+        Returns:
+            Priority score (higher is more urgent)
+        """
+        likelihood = self._estimate_exploitation_likelihood(risk)
+        
+        # Likelihood adds at most 9 points, so it orders plans within a
+        # severity band without lifting them into the next one
+        return round(SEVERITY_RANK.get(severity, 0) * 10 + 9 * likelihood, 2)
+    
+    def _estimate_exploitation_likelihood(self, risk: Dict) -> float:
+        """
+        Estimate how likely a risk is to be exploited.
+        
+        Uses an explicit exploitation_likelihood when the risk carries one,
+        then the ISO 31000 likelihood label, then the CVSS bands used by
+        RiskPredictor (>= 9.0 high, >= 7.0 medium, otherwise low).
+        
+        Args:
+            risk: Risk information
+            
+        Returns:
+            Likelihood between 0 and 1
+        """
+        likelihood = risk.get("exploitation_likelihood")
+        if isinstance(likelihood, str):
+            likelihood = LIKELIHOOD_PROBABILITY.get(likelihood.upper())
+        elif isinstance(likelihood, bool) or not isinstance(likelihood, (int, float)):
+            likelihood = None
+        
+        if likelihood is None:
+            likelihood = LIKELIHOOD_PROBABILITY.get(risk.get("likelihood"))
+        
+        if likelihood is None:
+            cvss_score = risk.get("cvss_score", 0)
+            if not isinstance(cvss_score, (int, float)):
+                cvss_score = 0
+            if cvss_score >= 9.0:
+                likelihood = LIKELIHOOD_PROBABILITY["HIGH"]
+            elif cvss_score >= 7.0:
+                likelihood = LIKELIHOOD_PROBABILITY["MEDIUM"]
+            else:
+                likelihood = LIKELIHOOD_PROBABILITY["LOW"]
+        
+        return min(max(float(likelihood), 0.0), 1.0)
+    
+    def _build_plan_template(self, risk_type: str, severity: str, vulnerability: Dict) -> Dict:
+        """
+        Build the risk-independent body of a mitigation plan.
+        
+        Args:
+            risk_type: Type of risk
+            severity: Risk severity
+            vulnerability: Vulnerability details
+            
+        Returns:
+            Mitigation plan without risk_id, implementation steps or priority
+        """
         # Get mitigation strategies
-        strategies = self._get_mitigation_strategies(risk_type, vulnerability)
+        strategy_keys = self._get_strategy_keys(risk_type, vulnerability)
+        strategies = self._get_mitigation_strategies(strategy_keys)
+        aggregate = self._combine_aggregates(strategy_keys)
         
         # Determine implementation timeframe
         timeframe = self._determine_timeframe(severity)
         
         # Calculate estimated effort
-        effort = self._estimate_effort(strategies)
+        effort = self._estimate_effort(aggregate["hours"])
         
         # Get required resources
-        resources = self._identify_resources(strategies)
+        resources = tuple(aggregate["resources"])
         
-        plan = {
-            "risk_id": risk.get("risk_id", "Unknown"),
+        # Estimate cost
+        cost_estimate = self._estimate_cost(aggregate["hours"], aggregate["tool_cost"])
+        
+        return {
             "risk_type": risk_type,
             "severity": severity,
-            "strategies": strategies,
-            "implementation_steps": self._generate_implementation_steps(strategies),
+            "strategies": tuple(strategies),
             "timeframe": timeframe,
             "estimated_effort": effort,
+            "estimated_effort_hours": aggregate["hours"],
             "required_resources": resources,
             "success_criteria": self._define_success_criteria(risk_type),
             "validation_method": self._define_validation_method(risk_type),
-            "cost_estimate": self._estimate_cost(strategies)
+            "cost_estimate": cost_estimate,
+            "total_cost_usd": cost_estimate["total_cost_usd"]
         }
-        
-        return plan
     
-    def _get_mitigation_strategies(self, risk_type: str, vulnerability: Dict) -> List[Dict]:
+    def _get_mitigation_strategies(self, keys: Tuple[str, ...]) -> List[Dict]:
         """
         Get specific mitigation strategies for risk type.
         
         Args:
-            risk_type: Type of risk
-            vulnerability: Vulnerability details
+            keys: Mitigation database keys from _get_strategy_keys
             
         Returns:
             List of mitigation strategies
         """
         strategies = []
+        for key in keys:
+            strategies.extend(self.mitigation_database[key])
+        
+        return strategies
+    
+    def _get_strategy_keys(self, risk_type: str, vulnerability: Dict) -> Tuple[str, ...]:
+        """
+        Get the mitigation database keys that apply to a risk.
+        
+        Args:
+            risk_type: Type of risk
+            vulnerability: Vulnerability details
+            
+        Returns:
+            Tuple of database keys, in strategy order
+        """
+        keys = []
         
         # Check mitigation database
         if risk_type in self.mitigation_database:
-            strategies.extend(self.mitigation_database[risk_type])
+            keys.append(risk_type)
         
         # Add vulnerability-specific mitigations
         vuln_type = vulnerability.get("type", "")
         if vuln_type in self.mitigation_database:
-            strategies.extend(self.mitigation_database[vuln_type])
+            keys.append(vuln_type)
         
         # Add general strategies if none found
-        if not strategies:
-            strategies = self.mitigation_database.get("General", [])
+        if not keys and "General" in self.mitigation_database:
+            keys.append("General")
         
-        return strategies
+        return tuple(keys)
+    
+    def _combine_aggregates(self, keys: Tuple[str, ...]) -> Dict:
+        """
+        Combine the pre-computed aggregates of several database keys.
+        
+        Args:
+            keys: Mitigation database keys
+            
+        Returns:
+            Dict with hours, tool_cost and resources
+        """
+        if len(keys) == 1:
+            return self._db_aggregates[keys[0]]
+        
+        aggregates = [self._db_aggregates[key] for key in keys]
+        return {
+            "hours": sum(agg["hours"] for agg in aggregates),
+            "tool_cost": sum(agg["tool_cost"] for agg in aggregates),
+            "resources": frozenset().union(*(agg["resources"] for agg in aggregates))
+        }
     
     def _generate_implementation_steps(self, strategies: List[Dict]) -> List[Dict]:
         """
@@ -125,21 +477,21 @@ class MitigationEngine:
         Returns:
             List of implementation steps
         """
-        steps = []
-        step_number = 1
-        
-        for strategy in strategies:
-            for step_desc in strategy.get("steps", []):
-                steps.append({
-                    "step_number": step_number,
-                    "description": step_desc,
-                    "responsible": "Security Team",
-                    "estimated_time": strategy.get("time_per_step", "1 hour"),
-                    "status": "PENDING"
-                })
-                step_number += 1
-        
-        return steps
+        step_pairs = chain.from_iterable(
+            ((strategy.get("time_per_step", "1 hour"), step_desc) for step_desc in strategy.get("steps", []))
+            for strategy in strategies
+        )
+        
+        return [
+            {
+                "step_number": step_number,
+                "description": step_desc,
+                "responsible": "Security Team",
+                "estimated_time": time_per_step,
+                "status": "PENDING"
+            }
+            for step_number, (time_per_step, step_desc) in enumerate(step_pairs, 1)
+        ]
     
     def _determine_timeframe(self, severity: str) -> str:
         """
@@ -159,18 +511,16 @@ class MitigationEngine:
         }
         return timeframes.get(severity, "As resources permit")
     
-    def _estimate_effort(self, strategies: List[Dict]) -> str:
+    def _estimate_effort(self, total_hours: float) -> str:
         """
         Estimate implementation effort.
         
         Args:
-            strategies: Mitigation strategies
+            total_hours: Total effort hours of the mitigation strategies
             
         Returns:
             Effort estimate
         """
-        total_hours = sum(strategy.get("effort_hours", 2) for strategy in strategies)
-        
         if total_hours < 4:
             return "Low (< 4 hours)"
         elif total_hours < 16:
@@ -178,24 +528,7 @@ class MitigationEngine:
         else:
             return "High (> 16 hours)"
     
-    def _identify_resources(self, strategies: List[Dict]) -> List[str]:
-        """
-        Identify required resources.
-        
-        Args:
-            strategies: Mitigation strategies
-            
-        Returns:
-            List of required resources
-        """
-        resources = set()
-        
-        for strategy in strategies:
-            resources.update(strategy.get("resources", []))
-        
-        return list(resources)
-    
-    def _define_success_criteria(self, risk_type: str) -> List[str]:
+    def _define_success_criteria(self, risk_type: str) -> Tuple[str, ...]:
         """
         Define success criteria for mitigation.
         
@@ -203,15 +536,9 @@ class MitigationEngine:
             risk_type: Type of risk
             
         Returns:
-            List of success criteria
+            Tuple of success criteria
         """
-        return [
-            "Vulnerability no longer detected in subsequent scans",
-            "Risk score reduced to acceptable level",
-            "No security incidents related to this risk",
-            "Compliance requirements met",
-            "System functionality maintained"
-        ]
+        return SUCCESS_CRITERIA
     
     def _define_validation_method(self, risk_type: str) -> str:
         """
@@ -223,23 +550,22 @@ class MitigationEngine:
         Returns:
             Validation method
         """
-        return "Re-scan with GRC tool + manual verification + penetration testing"
+        return VALIDATION_METHOD
     
-    def _estimate_cost(self, strategies: List[Dict]) -> Dict:
+    def _estimate_cost(self, total_hours: float, tool_cost: float) -> Dict:
         """
         Estimate implementation cost.
         
         Args:
-            strategies: Mitigation strategies
+            total_hours: Total effort hours of the mitigation strategies
+            tool_cost: Total tooling cost of the mitigation strategies
             
         Returns:
             Cost estimate
         """
-        total_hours = sum(strategy.get("effort_hours", 2) for strategy in strategies)
         hourly_rate = 150  # USD per hour
         
         labor_cost = total_hours * hourly_rate
-        tool_cost = sum(strategy.get("tool_cost", 0) for strategy in strategies)
         
         return {
             "labor_cost_usd": labor_cost,
@@ -258,175 +584,25 @@ class MitigationEngine:
         Returns:
             Organized mitigation strategy
         """
-        immediate = []
-        urgent = []
-        scheduled = []
-        routine = []
-        
-        for plan in plans:
-            timeframe = plan.get("timeframe", "")
-            if "Immediate" in timeframe:
-                immediate.append(plan)
-            elif "Urgent" in timeframe:
-                urgent.append(plan)
-            elif "Scheduled" in timeframe:
-                scheduled.append(plan)
-            else:
-                routine.append(plan)
+        buckets = {bucket: [] for bucket in SEVERITY_BUCKETS.values()}
         
-        return {
-            "immediate_actions": immediate,
-            "urgent_actions": urgent,
-            "scheduled_actions": scheduled,
-            "routine_actions": routine,
-            "total_plans": len(plans),
-            "summary": {
-                "immediate_count": len(immediate),
-                "urgent_count": len(urgent),
-                "scheduled_count": len(scheduled),
-                "routine_count": len(routine)
-            }
+        # Stable sort, so equally scored plans keep the risk prioritization order
+        for plan in sorted(plans, key=itemgetter("priority_score"), reverse=True):
+            buckets[SEVERITY_BUCKETS.get(plan.get("severity"), "routine")].append(plan)
+        
+        organized = {f"{bucket}_actions": bucket_plans for bucket, bucket_plans in buckets.items()}
+        organized["total_plans"] = len(plans)
+        organized["summary"] = {
+            f"{bucket}_count": len(bucket_plans) for bucket, bucket_plans in buckets.items()
         }
+        organized["summary"]["total_count"] = len(plans)
+        return organized
     
-    def _load_mitigation_database(self) -> Dict:
+    def _load_mitigation_database(self) -> MappingProxyType:
         """
         Load mitigation strategy database.
         
         Returns:
-            Dict of mitigation strategies
+            Read-only mapping of mitigation strategies
         """
-        return {
-            "Outdated Software": [
-                {
-                    "strategy": "Update to Latest Version",
-                    "description": "Apply latest security patches and updates",
-                    "steps": [
-                        "Backup current system configuration",
-                        "Test update in staging environment",
-                        "Schedule maintenance window",
-                        "Apply updates to production",
-                        "Verify system functionality",
-                        "Document changes"
-                    ],
-                    "effort_hours": 4,
-                    "resources": ["System Administrator", "Patch Management Tools"],
-                    "time_per_step": "30-60 minutes"
-                }
-            ],
-            "Default Credentials": [
-                {
-                    "strategy": "Change Default Credentials",
-                    "description": "Implement strong authentication",
-                    "steps": [
-                        "Identify all accounts with default credentials",
-                        "Generate strong passwords per policy",
-                        "Update credentials in systems",
-                        "Update dependent systems and scripts",
-                        "Document new credentials securely",
-                        "Verify authentication works correctly"
-                    ],
-                    "effort_hours": 2,
-                    "resources": ["Security Administrator", "Password Manager"],
-                    "time_per_step": "15-30 minutes"
-                },
-                {
-                    "strategy": "Implement MFA",
-                    "description": "Add multi-factor authentication",
-                    "steps": [
-                        "Select MFA solution",
-                        "Configure MFA for critical systems",
-                        "Enroll users in MFA",
-                        "Test MFA functionality",
-                        "Document MFA procedures"
-                    ],
-                    "effort_hours": 8,
-                    "resources": ["Security Team", "MFA Solution", "User Training"],
-                    "time_per_step": "1-2 hours",
-                    "tool_cost": 500
-                }
-            ],
-            "SSL/TLS Configuration": [
-                {
-                    "strategy": "Strengthen SSL/TLS Configuration",
-                    "description": "Implement secure cryptographic configuration",
-                    "steps": [
-                        "Disable SSLv2, SSLv3, TLS 1.0, TLS 1.1",
-                        "Enable TLS 1.2 and TLS 1.3",
-                        "Configure strong cipher suites",
-                        "Implement HSTS",
-                        "Update SSL certificates if needed",
-                        "Test configuration with SSL Labs"
-                    ],
-                    "effort_hours": 3,
-                    "resources": ["Network Administrator", "SSL/TLS Tools"],
-                    "time_per_step": "30 minutes"
-                }
-            ],
-            "Weak Cipher Suites": [
-                {
-                    "strategy": "Update Cipher Configuration",
-                    "description": "Remove weak ciphers and implement strong ones",
-                    "steps": [
-                        "Audit current cipher configuration",
-                        "Disable weak ciphers (RC4, DES, 3DES)",
-                        "Enable strong ciphers (AES-256-GCM)",
-                        "Test compatibility with clients",
-                        "Monitor for connection issues",
-                        "Document configuration changes"
-                    ],
-                    "effort_hours": 2,
-                    "resources": ["Security Administrator"],
-                    "time_per_step": "20 minutes"
-                }
-            ],
-            "Missing Security Patches": [
-                {
-                    "strategy": "Implement Patch Management",
-                    "description": "Establish systematic patching process",
-                    "steps": [
-                        "Inventory all systems and software",
-                        "Subscribe to security advisories",
-                        "Test patches in staging",
-                        "Deploy patches to production",
-                        "Verify patch installation",
-                        "Establish regular patching schedule"
-                    ],
-                    "effort_hours": 6,
-                    "resources": ["IT Team", "Patch Management System", "Testing Environment"],
-                    "time_per_step": "1 hour"
-                }
-            ],
-            "Service Misconfiguration": [
-                {
-                    "strategy": "Harden Service Configuration",
-                    "description": "Apply security hardening best practices",
-                    "steps": [
-                        "Review current configuration",
-                        "Apply CIS benchmarks or hardening guides",
-                        "Disable unnecessary features",
-                        "Implement least privilege",
-                        "Enable security logging",
-                        "Test service functionality"
-                    ],
-                    "effort_hours": 4,
-                    "resources": ["Security Team", "Configuration Management Tools"],
-                    "time_per_step": "40 minutes"
-                }
-            ],
-            "General": [
-                {
-                    "strategy": "General Security Enhancement",
-                    "description": "Apply general security best practices",
-                    "steps": [
-                        "Review security configurations",
-                        "Apply security updates",
-                        "Implement access controls",
-                        "Enable security monitoring",
-                        "Document changes"
-                    ],
-                    "effort_hours": 3,
-                    "resources": ["Security Team"],
-                    "time_per_step": "30-45 minutes"
-                }
-            ]
-        }
+        return _MITIGATION_DB
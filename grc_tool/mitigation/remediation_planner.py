@@ -4,11 +4,30 @@ Creates comprehensive remediation plans with resource allocation.
 """
 
 import logging
+from collections import defaultdict
+from itertools import chain
 from typing import Dict, List
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Remediation phases: (plan bucket, phase name, priority, phase duration)
+REMEDIATION_PHASES = (
+    ("immediate_actions", "Critical Remediation", "CRITICAL", timedelta(days=1)),
+    ("urgent_actions", "High Priority Remediation", "HIGH", timedelta(days=3)),
+    ("scheduled_actions", "Scheduled Remediation", "MEDIUM", timedelta(days=14)),
+    ("routine_actions", "Routine Remediation", "LOW", timedelta(days=30))
+)
+
+# Organized mitigation plan buckets, in phase order
+ACTION_BUCKETS = tuple(phase[0] for phase in REMEDIATION_PHASES)
+
+# Risk type keywords that mark a plan as part of a dependency group
+DEPENDENCY_KEYWORDS = {
+    "patch": "patching",
+    "config": "config"
+}
+
 
 class RemediationPlanner:
     """
@@ -32,20 +51,28 @@ class RemediationPlanner:
         """
         logger.info("Creating comprehensive remediation plan")
         
+        # One timestamp for both the plan and the start of its timeline
+        now = datetime.now()
+        
+        # Flatten the priority buckets once for the per-plan passes below
+        all_plans = list(chain.from_iterable(
+            mitigation_plans.get(bucket, []) for bucket in ACTION_BUCKETS
+        ))
+        
         # Create timeline
-        timeline = self._create_timeline(mitigation_plans)
+        timeline = self._create_timeline(mitigation_plans, now)
         
         # Allocate resources
-        resource_allocation = self._allocate_resources(mitigation_plans)
+        resource_allocation = self._allocate_resources(all_plans)
         
         # Create milestones
         milestones = self._define_milestones(timeline)
         
         # Calculate metrics
-        metrics = self._calculate_plan_metrics(mitigation_plans)
+        metrics = self._calculate_plan_metrics(all_plans)
         
         plan = {
-            "plan_created": datetime.now().isoformat(),
+            "plan_created": timeline["start_date"],
             "timeline": timeline,
             "resource_allocation": resource_allocation,
             "milestones": milestones,
@@ -57,117 +84,68 @@ class RemediationPlanner:
         logger.info("Remediation plan created successfully")
         return plan
     
-    def _create_timeline(self, mitigation_plans: Dict) -> Dict:
+    def _create_timeline(self, mitigation_plans: Dict, start_date: datetime) -> Dict:
         """
         Create implementation timeline.
         
         Args:
             mitigation_plans: Mitigation plans
+            start_date: Start of the first phase
             
         Returns:
             Timeline with phases
         """
-        start_date = datetime.now()
+        start_iso = start_date.isoformat()
         
         phases = []
         current_date = start_date
+        current_iso = start_iso
         
-        # Phase 1: Immediate actions
-        immediate = mitigation_plans.get("immediate_actions", [])
-        if immediate:
-            phase1_end = current_date + timedelta(days=1)
-            phases.append({
-                "phase": 1,
-                "name": "Critical Remediation",
-                "start_date": current_date.isoformat(),
-                "end_date": phase1_end.isoformat(),
-                "actions": len(immediate),
-                "priority": "CRITICAL"
-            })
-            current_date = phase1_end
-        
-        # Phase 2: Urgent actions
-        urgent = mitigation_plans.get("urgent_actions", [])
-        if urgent:
-            phase2_end = current_date + timedelta(days=3)
-            phases.append({
-                "phase": 2,
-                "name": "High Priority Remediation",
-                "start_date": current_date.isoformat(),
-                "end_date": phase2_end.isoformat(),
-                "actions": len(urgent),
-                "priority": "HIGH"
-            })
-            current_date = phase2_end
-        
-        # Phase 3: Scheduled actions
-        scheduled = mitigation_plans.get("scheduled_actions", [])
-        if scheduled:
-            phase3_end = current_date + timedelta(days=14)
-            phases.append({
-                "phase": 3,
-                "name": "Scheduled Remediation",
-                "start_date": current_date.isoformat(),
-                "end_date": phase3_end.isoformat(),
-                "actions": len(scheduled),
-                "priority": "MEDIUM"
-            })
-            current_date = phase3_end
-        
-        # Phase 4: Routine actions
-        routine = mitigation_plans.get("routine_actions", [])
-        if routine:
-            phase4_end = current_date + timedelta(days=30)
+        for number, (bucket, name, priority, duration) in enumerate(REMEDIATION_PHASES, 1):
+            actions = mitigation_plans.get(bucket, [])
+            if not actions:
+                continue
+            
+            current_date += duration
+            end_iso = current_date.isoformat()
             phases.append({
-                "phase": 4,
-                "name": "Routine Remediation",
-                "start_date": current_date.isoformat(),
-                "end_date": phase4_end.isoformat(),
-                "actions": len(routine),
-                "priority": "LOW"
+                "phase": number,
+                "name": name,
+                "start_date": current_iso,
+                "end_date": end_iso,
+                "actions": len(actions),
+                "priority": priority
             })
+            current_iso = end_iso
         
         return {
-            "start_date": start_date.isoformat(),
-            "estimated_completion": current_date.isoformat(),
+            "start_date": start_iso,
+            "estimated_completion": current_iso,
             "total_phases": len(phases),
             "phases": phases
         }
     
-    def _allocate_resources(self, mitigation_plans: Dict) -> Dict:
+    def _allocate_resources(self, all_plans: List[Dict]) -> Dict:
         """
         Allocate resources for remediation.
         
         Args:
-            mitigation_plans: Mitigation plans
+            all_plans: Mitigation plans from every priority bucket
             
         Returns:
             Resource allocation plan
         """
-        all_plans = (
-            mitigation_plans.get("immediate_actions", []) +
-            mitigation_plans.get("urgent_actions", []) +
-            mitigation_plans.get("scheduled_actions", []) +
-            mitigation_plans.get("routine_actions", [])
-        )
-        
         # Collect all required resources
-        resource_needs = {}
+        resource_needs = defaultdict(lambda: {"count": 0, "total_hours": 0.0, "phases": []})
+        get_effort_hours = self._get_effort_hours
         for plan in all_plans:
-            for resource in plan.get("required_resources", []):
-                if resource not in resource_needs:
-                    resource_needs[resource] = {
-                        "count": 0,
-                        "total_hours": 0,
-                        "phases": []
-                    }
-                resource_needs[resource]["count"] += 1
-                
-                # Estimate hours from effort
-                effort = plan.get("estimated_effort", "Low (< 4 hours)")
-                hours = self._parse_effort_hours(effort)
-                resource_needs[resource]["total_hours"] += hours
+            hours = get_effort_hours(plan)
+            for resource in plan.get("required_resources", ()):
+                entry = resource_needs[resource]
+                entry["count"] += 1
+                entry["total_hours"] += hours
         
+        resource_needs = dict(resource_needs)
         return {
             "resource_requirements": resource_needs,
             "total_resource_types": len(resource_needs),
@@ -204,32 +182,19 @@ class RemediationPlanner:
         
         return milestones
     
-    def _calculate_plan_metrics(self, mitigation_plans: Dict) -> Dict:
+    def _calculate_plan_metrics(self, all_plans: List[Dict]) -> Dict:
         """
         Calculate plan metrics.
         
         Args:
-            mitigation_plans: Mitigation plans
+            all_plans: Mitigation plans from every priority bucket
             
         Returns:
             Plan metrics
         """
-        all_plans = (
-            mitigation_plans.get("immediate_actions", []) +
-            mitigation_plans.get("urgent_actions", []) +
-            mitigation_plans.get("scheduled_actions", []) +
-            mitigation_plans.get("routine_actions", [])
-        )
-        
-        total_cost = sum(
-            plan.get("cost_estimate", {}).get("total_cost_usd", 0)
-            for plan in all_plans
-        )
-        
-        total_effort = sum(
-            self._parse_effort_hours(plan.get("estimated_effort", "Low (< 4 hours)"))
-            for plan in all_plans
-        )
+        total_cost = sum(map(self._get_plan_cost, all_plans))
+        
+        total_effort = sum(map(self._get_effort_hours, all_plans))
         
         return {
             "total_actions": len(all_plans),
@@ -260,7 +225,9 @@ class RemediationPlanner:
                 "mitigation": "Consider additional resources or prioritize further"
             })
         
-        if summary.get("total_count", 0) > 20:
+        # Plans organized before total_count existed only carry total_plans
+        total_count = summary.get("total_count", mitigation_plans.get("total_plans", 0))
+        if total_count > 20:
             risks.append({
                 "risk": "Project Complexity",
                 "description": "Large number of actions increases project complexity",
@@ -288,24 +255,58 @@ class RemediationPlanner:
         # Simplified dependency identification
         dependencies = []
         
-        all_plans = (
-            mitigation_plans.get("immediate_actions", []) +
+        # Look for common dependencies in a single pass over the priority actions
+        group_counts = defaultdict(int)
+        for plan in chain(
+            mitigation_plans.get("immediate_actions", []),
             mitigation_plans.get("urgent_actions", [])
-        )
-        
-        # Look for common dependencies
-        patching_plans = [p for p in all_plans if "patch" in p.get("risk_type", "").lower()]
-        config_plans = [p for p in all_plans if "config" in p.get("risk_type", "").lower()]
+        ):
+            risk_type = plan.get("risk_type", "").lower()
+            for keyword, group in DEPENDENCY_KEYWORDS.items():
+                if keyword in risk_type:
+                    group_counts[group] += 1
         
-        if patching_plans and config_plans:
+        if group_counts["patching"] and group_counts["config"]:
             dependencies.append({
                 "dependency": "Patching before Configuration",
                 "description": "Apply patches before reconfiguring services",
-                "affected_actions": len(patching_plans) + len(config_plans)
+                "affected_actions": group_counts["patching"] + group_counts["config"]
             })
         
         return dependencies
     
+    def _get_effort_hours(self, plan: Dict) -> float:
+        """
+        Get effort hours for a mitigation plan.
+        
+        Args:
+            plan: Mitigation plan
+            
+        Returns:
+            Hours as float
+        """
+        hours = plan.get("estimated_effort_hours")
+        if hours is None:
+            # Plans built without the numeric field only carry the effort label
+            return self._parse_effort_hours(plan.get("estimated_effort", "Low (< 4 hours)"))
+        return float(hours)
+    
+    def _get_plan_cost(self, plan: Dict) -> float:
+        """
+        Get total cost for a mitigation plan.
+        
+        Args:
+            plan: Mitigation plan
+            
+        Returns:
+            Total cost in USD
+        """
+        cost = plan.get("total_cost_usd")
+        if cost is None:
+            # Plans built without the flattened field only carry cost_estimate
+            return plan.get("cost_estimate", {}).get("total_cost_usd", 0)
+        return cost
+    
     def _parse_effort_hours(self, effort_string: str) -> float:
         """
         Parse effort hours from string.
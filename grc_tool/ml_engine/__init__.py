@@ -1,7 +1,21 @@
 """Machine Learning Engine Module"""
 
-from .threat_detector import ThreatDetector
-from .anomaly_detector import AnomalyDetector
-from .risk_predictor import RiskPredictor
+import importlib
 
 __all__ = ["ThreatDetector", "AnomalyDetector", "RiskPredictor"]
+
+# Each detector lives in its own submodule, imported only when first requested
+# so that enabling one ML stage does not load the others' dependencies.
+_SUBMODULES = {
+    "ThreatDetector": ".threat_detector",
+    "AnomalyDetector": ".anomaly_detector",
+    "RiskPredictor": ".risk_predictor",
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = getattr(importlib.import_module(_SUBMODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
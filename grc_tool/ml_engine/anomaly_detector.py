@@ -4,13 +4,21 @@ Detects abnormal patterns and behaviors in network traffic and system activities
 """
 
 import logging
+from contextlib import nullcontext
 import numpy as np
 from typing import Dict, List
+from joblib import parallel_backend
 from sklearn.ensemble import IsolationForest
 from sklearn.preprocessing import StandardScaler
 
 logger = logging.getLogger(__name__)
 
+# Below this many rows, thread pool start-up costs more than parallel scoring
+# saves. IsolationForest's n_jobs only applies to fit; scoring (scikit-learn
+# >= 1.6) parallelizes only under an active joblib backend, and older releases
+# score sequentially either way.
+PARALLEL_SCORING_MIN_ROWS = 2048
+
 
 class AnomalyDetector:
     """
@@ -29,7 +37,8 @@ class AnomalyDetector:
         self.model = IsolationForest(
             contamination=contamination,
             random_state=42,
-            n_estimators=100
+            n_estimators=100,
+            n_jobs=-1
         )
         self.scaler = StandardScaler()
         self.baseline_established = False
@@ -49,22 +58,28 @@ class AnomalyDetector:
         logger.info("Detecting anomalies in scan results")
         anomalies = []
         
-        for host, host_data in scan_results.get("hosts", {}).items():
-            # Extract features
-            features = self._extract_anomaly_features(host_data)
-            
-            # Detect anomaly
-            is_anomaly, score = self._is_anomalous(features)
-            
-            if is_anomaly:
-                anomaly_info = {
-                    "host": host,
-                    "anomaly_score": score,
-                    "severity": self._get_anomaly_severity(score),
-                    "description": self._describe_anomaly(host_data, features),
-                    "type": "Network Anomaly"
-                }
-                anomalies.append(anomaly_info)
+        hosts = list(scan_results.get("hosts", {}).items())
+        if not hosts:
+            logger.info("Detected 0 anomalies")
+            return anomalies
+        
+        # Extract features for every host into one (n_hosts, 7) matrix
+        features = np.vstack([self._extract_anomaly_features(host_data) for _, host_data in hosts])
+        
+        # Detect anomalies for all hosts at once
+        is_anomaly, scores = self._is_anomalous(features)
+        
+        for index in np.flatnonzero(is_anomaly):
+            host, host_data = hosts[index]
+            score = float(scores[index])
+            anomaly_info = {
+                "host": host,
+                "anomaly_score": score,
+                "severity": self._get_anomaly_severity(score),
+                "description": self._describe_anomaly(host_data, features[index:index + 1]),
+                "type": "Network Anomaly"
+            }
+            anomalies.append(anomaly_info)
         
         logger.info(f"Detected {len(anomalies)} anomalies")
         return anomalies
@@ -79,13 +94,14 @@ class AnomalyDetector:
         Returns:
             Feature vector
         """
-        features = []
-        
-        # Port count features
         total_ports = 0
         tcp_ports = 0
         udp_ports = 0
+        high_ports = 0
+        unknown_count = 0
+        unique_services = set()
         
+        # Single pass over every open port
         for proto, ports in host_data.get("protocols", {}).items():
             port_count = len(ports)
             total_ports += port_count
@@ -93,100 +109,79 @@ class AnomalyDetector:
                 tcp_ports = port_count
             elif proto == "udp":
                 udp_ports = port_count
-        
-        features.extend([total_ports, tcp_ports, udp_ports])
-        
-        # Service diversity
-        unique_services = set()
-        for proto, ports in host_data.get("protocols", {}).items():
+            
             for port, info in ports.items():
                 service = info.get("name", "unknown")
                 unique_services.add(service)
+                unknown_count += service == "unknown"
+                high_ports += port > 1024
+        
+        # Port counts, service diversity, high/low port usage, unknown services ratio
+        features = (
+            total_ports,
+            tcp_ports,
+            udp_ports,
+            len(unique_services),
+            high_ports,
+            total_ports - high_ports,
+            unknown_count / max(total_ports, 1)
+        )
         
-        features.append(len(unique_services))
-        
-        # High port usage (ports > 1024)
-        high_ports = 0
-        low_ports = 0
-        for proto, ports in host_data.get("protocols", {}).items():
-            for port in ports.keys():
-                if port > 1024:
-                    high_ports += 1
-                else:
-                    low_ports += 1
-        
-        features.extend([high_ports, low_ports])
-        
-        # Unknown services ratio
-        unknown_count = 0
-        total_services = 0
-        for proto, ports in host_data.get("protocols", {}).items():
-            for port, info in ports.items():
-                total_services += 1
-                if info.get("name", "unknown") == "unknown":
-                    unknown_count += 1
-        
-        unknown_ratio = unknown_count / max(total_services, 1)
-        features.append(unknown_ratio)
-        
-        return np.array(features).reshape(1, -1)
+        return np.fromiter(features, dtype=np.float64, count=len(features)).reshape(1, -1)
     
     def _is_anomalous(self, features: np.ndarray) -> tuple:
         """
-        Check if features represent an anomaly.
+        Check which feature rows represent an anomaly.
         
         Args:
-            features: Feature vector
+            features: Feature matrix, one row per host
             
         Returns:
-            Tuple of (is_anomaly, score)
+            Tuple of (is_anomaly, scores) arrays, one entry per row
         """
         # Simple threshold-based detection if model not trained
         if not self.baseline_established:
-            score = self._calculate_simple_anomaly_score(features[0])
-            is_anomaly = score > 0.6
-            return is_anomaly, score
+            scores = self._calculate_simple_anomaly_score(features)
+            return scores > 0.6, scores
         
         # Use trained model
-        prediction = self.model.predict(features)
-        score = -self.model.score_samples(features)[0]
+        if len(features) >= PARALLEL_SCORING_MIN_ROWS:
+            backend = parallel_backend("threading", n_jobs=-1)
+        else:
+            backend = nullcontext()
         
-        return prediction[0] == -1, score
+        with backend:
+            raw_scores = self.model.score_samples(features)
+        
+        # predict() flags rows whose score falls below offset_; derive that from
+        # the scores already computed instead of scoring every row twice
+        return raw_scores < self.model.offset_, -raw_scores
     
-    def _calculate_simple_anomaly_score(self, features: np.ndarray) -> float:
+    def _calculate_simple_anomaly_score(self, features: np.ndarray) -> np.ndarray:
         """
-        Calculate anomaly score without trained model.
+        Calculate anomaly scores without trained model.
         
         Args:
-            features: Feature vector
+            features: Feature matrix, one row per host
             
         Returns:
-            Anomaly score (0-1)
+            Anomaly scores (0-1), one per row
         """
         # Normalize and score
-        total_ports = features[0]
-        high_ports = features[4]
-        unknown_ratio = features[6]
-        
-        score = 0.0
+        total_ports = features[:, 0]
+        high_ports = features[:, 4]
+        unknown_ratio = features[:, 6]
         
         # Too many open ports
-        if total_ports > 50:
-            score += 0.3
-        elif total_ports > 20:
-            score += 0.2
+        score = np.where(total_ports > 50, 0.3, np.where(total_ports > 20, 0.2, 0.0))
         
         # Too many high ports
-        if high_ports > 30:
-            score += 0.2
+        score += np.where(high_ports > 30, 0.2, 0.0)
         
         # High unknown service ratio
-        if unknown_ratio > 0.5:
-            score += 0.3
-        elif unknown_ratio > 0.3:
-            score += 0.2
+        score += np.where(unknown_ratio > 0.5, 0.3, np.where(unknown_ratio > 0.3, 0.2, 0.0))
         
-        return min(score, 1.0)
+        return np.minimum(score, 1.0)
     
     def _get_anomaly_severity(self, score: float) -> str:
         """
@@ -5,12 +5,19 @@ Generates comprehensive security and compliance reports.
 
 import logging
 import json
+from collections import Counter
 from typing import Dict, List
 from datetime import datetime
 import os
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for saved reports; json.dump emits many small chunks.
+REPORT_WRITE_BUFFER = 1 << 20
+
+_DATE_FMT = "%Y-%m-%d"
+_FILE_TS_FMT = "%Y%m%d_%H%M%S"
+
 
 class ReportGenerator:
     """
@@ -41,42 +48,67 @@ class ReportGenerator:
         """
         logger.info("Generating comprehensive report")
         
+        # One clock reading stamps every section and the output filename
+        generated_at = datetime.now()
+        
         report = {
-            "report_metadata": self._create_metadata(),
-            "executive_summary": self._create_executive_summary(scan_data),
+            "report_metadata": self._create_metadata(generated_at),
+            "executive_summary": self._create_executive_summary(scan_data, generated_at),
             "scan_results": scan_data.get("scan_results", {}),
             "risk_assessment": scan_data.get("risk_assessment", {}),
-            "threat_analysis": scan_data.get("threat_analysis", {}),
+            "threat_analysis": self._create_threat_analysis(scan_data),
             "mitigation_plan": scan_data.get("mitigation_plan", {}),
             "remediation_plan": scan_data.get("remediation_plan", {}),
-            "compliance_status": self._assess_compliance(scan_data),
+            "compliance_status": self._assess_compliance(scan_data, generated_at),
             "recommendations": self._compile_recommendations(scan_data),
             "appendices": self._create_appendices(scan_data)
         }
         
         # Save report
-        self._save_report(report)
+        self._save_report(report, generated_at)
         
         logger.info("Comprehensive report generated successfully")
         return report
     
-    def _create_metadata(self) -> Dict:
+    def _create_metadata(self, generated_at: datetime) -> Dict:
         """Create report metadata."""
         return {
             "report_title": "GRC Compliance Assessment Report",
             "report_type": "ISO 31000 Risk Assessment",
-            "generated_date": datetime.now().isoformat(),
+            "generated_date": generated_at.isoformat(),
             "tool_version": "1.0.0",
             "standards": ["ISO 31000:2018", "ISO/IEC 27001", "NIST CSF"],
             "report_format": "JSON"
         }
     
-    def _create_executive_summary(self, scan_data: Dict) -> Dict:
+    def _create_threat_analysis(self, scan_data: Dict) -> Dict:
+        """
+        Create threat analysis section.
+        
+        Threats and anomalies are read from the top-level scan data, so the
+        caller does not need to duplicate them under "threat_analysis".
+        
+        Args:
+            scan_data: Scan data
+            
+        Returns:
+            Threat analysis
+        """
+        if "threat_analysis" in scan_data:
+            return scan_data["threat_analysis"]
+        
+        return {
+            "threats": scan_data.get("threats", []),
+            "anomalies": scan_data.get("anomalies", [])
+        }
+    
+    def _create_executive_summary(self, scan_data: Dict, generated_at: datetime) -> Dict:
         """
         Create executive summary.
         
         Args:
             scan_data: Scan data
+            generated_at: Report generation time
             
         Returns:
             Executive summary
@@ -85,28 +117,26 @@ class ReportGenerator:
         vulnerabilities = scan_data.get("vulnerabilities", [])
         threats = scan_data.get("threats", [])
         
+        evaluated_risks = risk_assessment.get("evaluated_risks", [])
+        
         # Calculate key metrics
-        total_risks = len(risk_assessment.get("evaluated_risks", []))
-        critical_risks = sum(
-            1 for r in risk_assessment.get("evaluated_risks", [])
-            if r.get("risk_level") == "EXTREME"
-        )
+        total_risks = len(evaluated_risks)
+        level_counts = Counter(r.get("risk_level") for r in evaluated_risks)
+        critical_risks = level_counts["EXTREME"]
+        high_risks = level_counts["HIGH"]
         
         summary = {
             "assessment_scope": "Network infrastructure and end-user systems",
-            "assessment_date": datetime.now().strftime("%Y-%m-%d"),
+            "assessment_date": generated_at.strftime(_DATE_FMT),
             "key_findings": {
                 "total_hosts_scanned": len(scan_data.get("scan_results", {}).get("hosts", {})),
                 "total_vulnerabilities": len(vulnerabilities),
                 "total_risks_identified": total_risks,
                 "critical_risks": critical_risks,
-                "high_risks": sum(
-                    1 for r in risk_assessment.get("evaluated_risks", [])
-                    if r.get("risk_level") == "HIGH"
-                ),
+                "high_risks": high_risks,
                 "threats_detected": len(threats)
             },
-            "overall_risk_rating": self._calculate_overall_risk(risk_assessment),
+            "overall_risk_rating": self._calculate_overall_risk(critical_risks, high_risks),
             "compliance_status": "PARTIAL" if critical_risks > 0 else "COMPLIANT",
             "immediate_actions_required": critical_risks,
             "key_recommendations": [
@@ -120,12 +150,13 @@ class ReportGenerator:
         
         return summary
     
-    def _assess_compliance(self, scan_data: Dict) -> Dict:
+    def _assess_compliance(self, scan_data: Dict, generated_at: datetime) -> Dict:
         """
         Assess compliance with standards.
         
         Args:
             scan_data: Scan data
+            generated_at: Report generation time
             
         Returns:
             Compliance assessment
@@ -156,7 +187,7 @@ class ReportGenerator:
         
         return {
             "iso_31000": iso31000_compliance,
-            "assessment_date": datetime.now().isoformat()
+            "assessment_date": generated_at.isoformat()
         }
     
     def _compile_recommendations(self, scan_data: Dict) -> List[Dict]:
@@ -238,16 +269,8 @@ class ReportGenerator:
             "methodology": "ML-based vulnerability detection with ISO 31000 risk assessment framework"
         }
     
-    def _calculate_overall_risk(self, risk_assessment: Dict) -> str:
-        """Calculate overall risk rating."""
-        evaluated_risks = risk_assessment.get("evaluated_risks", [])
-        
-        if not evaluated_risks:
-            return "LOW"
-        
-        extreme_count = sum(1 for r in evaluated_risks if r.get("risk_level") == "EXTREME")
-        high_count = sum(1 for r in evaluated_risks if r.get("risk_level") == "HIGH")
-        
+    def _calculate_overall_risk(self, extreme_count: int, high_count: int) -> str:
+        """Calculate overall risk rating from precomputed risk-level counts."""
         if extreme_count > 0:
             return "CRITICAL"
         elif high_count > 3:
@@ -257,19 +280,20 @@ class ReportGenerator:
         else:
             return "LOW"
     
-    def _save_report(self, report: Dict):
+    def _save_report(self, report: Dict, generated_at: datetime):
         """
         Save report to file.
         
         Args:
             report: Report data
+            generated_at: Report generation time, used in the filename
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = generated_at.strftime(_FILE_TS_FMT)
         filename = f"grc_report_{timestamp}.json"
         filepath = os.path.join(self.output_dir, filename)
         
         try:
-            with open(filepath, 'w') as f:
+            with open(filepath, 'w', buffering=REPORT_WRITE_BUFFER) as f:
                 json.dump(report, f, indent=2)
             logger.info(f"Report saved to {filepath}")
         except Exception as e:
@@ -308,10 +332,12 @@ IMMEDIATE ACTIONS REQUIRED: {exec_summary.get('immediate_actions_required', 0)}
 
 TOP RECOMMENDATIONS:
 """
-        for i, rec in enumerate(exec_summary.get('key_recommendations', []), 1):
-            summary += f"{i}. {rec}\n"
-        
-        summary += f"\n{'=' * 60}\n"
-        summary += "Full report available in JSON format.\n"
+        parts = [summary]
+        parts.extend(
+            f"{i}. {rec}\n"
+            for i, rec in enumerate(exec_summary.get('key_recommendations', []), 1)
+        )
+        parts.append(f"\n{'=' * 60}\n")
+        parts.append("Full report available in JSON format.\n")
         
-        return summary
+        return "".join(parts)
@@ -74,11 +74,14 @@ class ISO31000Framework:
         
         return self.context
     
-    def define_risk_criteria(self) -> Dict:
+    def define_risk_criteria(self, risk_appetite: float = 5.0) -> Dict:
         """
         Step 2: Define Risk Criteria (ISO 31000 Clause 5.3.5)
         Establish criteria for evaluating significance of risk.
         
+        Args:
+            risk_appetite: CVSS score threshold above which risks need treatment
+            
         Returns:
             Risk criteria definition
         """
@@ -88,7 +91,7 @@ class ISO31000Framework:
             "risk_appetite": {
                 "description": "Maximum risk organization is willing to accept",
                 "level": "LOW",
-                "threshold": 5.0  # CVSS score threshold
+                "threshold": risk_appetite  # CVSS score threshold
             },
             "risk_tolerance": {
                 "description": "Acceptable deviation from risk appetite",
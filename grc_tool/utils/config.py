@@ -7,6 +7,8 @@ import json
 import os
 from typing import Dict, Any
 
+_MISSING = object()
+
 
 class Config:
     """
@@ -21,6 +23,7 @@ class Config:
             config_file: Path to configuration file
         """
         self.config = self._load_default_config()
+        self._lookup_cache: Dict[str, Any] = {}
         
         if config_file and os.path.exists(config_file):
             self._load_config_file(config_file)
@@ -93,11 +96,19 @@ class Config:
                 self.config[key].update(value)
             else:
                 self.config[key] = value
+        
+        self.clear_cache()
     
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value.
         
+        Resolved leaf values (and misses) are memoized until the next set(),
+        file merge or clear_cache(). Sub-sections are returned live and are
+        not memoized. After editing ``self.config`` or a returned section in
+        place, call clear_cache() (or use set()) so later lookups see the
+        change.
+        
         Args:
             key: Configuration key (supports dot notation)
             default: Default value if key not found
@@ -105,17 +116,43 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
+        value = self._lookup_cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._resolve(key)
+            if not isinstance(value, dict):
+                self._lookup_cache[key] = value
+        
+        return default if value is _MISSING else value
+    
+    def _resolve(self, key: str) -> Any:
+        """
+        Walk a dotted key through the configuration tree.
+        
+        Args:
+            key: Configuration key (supports dot notation)
+            
+        Returns:
+            Configuration value, or _MISSING if the path does not exist
+        """
         value = self.config
         
-        for k in keys:
+        for k in key.split('.'):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _MISSING
         
         return value
     
+    def clear_cache(self):
+        """
+        Drop memoized lookups.
+        
+        Needed only after modifying the configuration in place rather than
+        through set().
+        """
+        self._lookup_cache.clear()
+    
     def set(self, key: str, value: Any):
         """
         Set configuration value.
@@ -133,6 +170,7 @@ class Config:
             config = config[k]
         
         config[keys[-1]] = value
+        self.clear_cache()
     
     def save(self, filepath: str):
         """
@@ -7,6 +7,12 @@ import sys
 from datetime import datetime
 import os
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Shared by every handler setup_logging installs
+LOG_FORMATTER = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+
 
 def setup_logging(level: str = "INFO", log_file: str = None) -> logging.Logger:
     """
@@ -25,31 +31,25 @@ def setup_logging(level: str = "INFO", log_file: str = None) -> logging.Logger:
         if log_dir:
             os.makedirs(log_dir, exist_ok=True)
     
-    # Configure logging format
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    date_format = '%Y-%m-%d %H:%M:%S'
-    
     # Set logging level
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     
     # Configure root logger
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(LOG_FORMATTER)
     logging.basicConfig(
         level=numeric_level,
-        format=log_format,
-        datefmt=date_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[stream_handler]
     )
     
     # Add file handler if specified
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(numeric_level)
-        file_handler.setFormatter(logging.Formatter(log_format, date_format))
+        file_handler.setFormatter(LOG_FORMATTER)
         logging.getLogger().addHandler(file_handler)
     
     logger = logging.getLogger('GRC-Tool')
-    logger.info(f"Logging initialized at {level} level")
+    logger.info("Logging initialized at %s level", level)
     
     return logger